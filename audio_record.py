@@ -1,92 +1,576 @@
 import sys
+import os
+import math
 import whisper
+import torch
 import sounddevice as sd
 import numpy as np
 import signal
-import tempfile
+import socket
+import threading
+import queue
+import functools
+import weakref
+from multiprocessing.sharedctypes import RawValue
+from scipy.signal import resample_poly, firwin
 #from PySide2.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QComboBox, QTextEdit, QMessageBox
 #from PySide2.QtCore import Qt, QThread, Signal, QTimer
-from PySide2.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QComboBox, QTextEdit, QMessageBox
-from PySide2.QtCore import Qt, QThread, Signal as QtSignal, QTimer
-import soundfile as sf
+from PySide2.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QComboBox, QTextEdit, QMessageBox, QCheckBox
+from PySide2.QtGui import QTextCursor
+from PySide2.QtCore import Qt, QThread, Signal as QtSignal, QSocketNotifier
+
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import WhisperProcessor
+except ImportError:
+    ORTModelForSpeechSeq2Seq = None
+
+try:
+    from ipex_llm import optimize_model
+except ImportError:
+    optimize_model = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# Let cuBLAS use TF32 tensor cores for the remaining FP32 matmuls
+torch.set_float32_matmul_precision("high")
+
+def default_device():
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+def use_fp16(device):
+    # FP16 only pays off on GPUs with tensor cores (compute capability 7.0+);
+    # older GPUs and the CPU stay on FP32
+    if device != "cuda" or not torch.cuda.is_available():
+        return False
+    major, _ = torch.cuda.get_device_capability()
+    return major >= 7
+
+def default_backend():
+    # Prefer the CTranslate2 backend, fall back to the reference PyTorch one
+    return "faster" if WhisperModel is not None else "whisper"
+
+def available_backends():
+    backends = ["whisper"]
+    if WhisperModel is not None:
+        backends.insert(0, "faster")
+    if (ORTModelForSpeechSeq2Seq is not None and torch.cuda.is_available()
+            and "TensorrtExecutionProvider" in onnxruntime.get_available_providers()):
+        backends.append("trt")
+    return backends
+
+def compute_type(device):
+    # INT8 weights everywhere, FP16 activations where tensor cores exist
+    return "int8_float16" if use_fp16(device) else "int8"
+
+# Experimental: set WHISPER_TORCH_COMPILE=1 to compile the reference model.
+# openai-whisper's KV cache grows per token, so reduce-overhead may record a
+# new CUDA graph per length; measure before relying on it.
+TORCH_COMPILE = os.environ.get("WHISPER_TORCH_COMPILE") == "1"
+
+def compile_model(model, device):
+    # CUDA graph capture targets the per-token kernel launch overhead of the
+    # decoder. torch.compile is lazy, so errors only surface on the first
+    # forward: run one on silence here and put the eager modules back if it fails.
+    if not hasattr(torch, "compile"):
+        return model
+    encoder, decoder = model.encoder, model.decoder
+    try:
+        model.encoder = torch.compile(encoder, mode="reduce-overhead")
+        model.decoder = torch.compile(decoder, mode="reduce-overhead", fullgraph=False)
+        model.transcribe(np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32), fp16=use_fp16(device))
+    except Exception as e:
+        print(f"torch.compile failed, using eager mode: {e}")
+        model.encoder, model.decoder = encoder, decoder
+    return model
+
+# ONNX exports and TensorRT engines, one directory per (model, GPU arch, precision)
+TRT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "whisper_trt")
+
+class TensorRTWhisper:
+    # Hugging Face Whisper exported to ONNX and run through ONNX Runtime's
+    # TensorRT provider. The export and the built engines are cached on disk,
+    # so only the very first load pays for them.
+    def __init__(self, name, device):
+        major, minor = torch.cuda.get_device_capability()
+        precision = "fp16" if use_fp16(device) else "fp32"
+        cache_dir = os.path.join(TRT_CACHE_DIR, f"{name}_sm{major}{minor}_{precision}")
+        onnx_dir = os.path.join(cache_dir, "onnx")
+        provider_options = {
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": os.path.join(cache_dir, "engines"),
+            "trt_fp16_enable": precision == "fp16",
+        }
+        # The TensorRT provider only creates the leaf engine directory
+        os.makedirs(provider_options["trt_engine_cache_path"], exist_ok=True)
+
+        export = not os.path.isdir(onnx_dir)
+        source = f"openai/whisper-{name}" if export else onnx_dir
+        self.model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            source, export=export, provider="TensorrtExecutionProvider", provider_options=provider_options)
+        self.processor = WhisperProcessor.from_pretrained(source)
+        if export:
+            self.model.save_pretrained(onnx_dir)
+            self.processor.save_pretrained(onnx_dir)
+
+    def transcribe(self, audio):
+        # The feature extractor truncates to Whisper's 30 s context, so longer
+        # recordings are transcribed window by window
+        if not audio.size:
+            return "", None
+        window = 30 * WHISPER_SAMPLE_RATE
+        texts = []
+        language = None
+        for start in range(0, audio.size, window):
+            features = self.processor(audio[start:start + window], sampling_rate=WHISPER_SAMPLE_RATE,
+                                      return_tensors="pt").input_features
+            tokens = self.model.generate(features.to(self.model.device))[0]
+            texts.append(self.processor.decode(tokens, skip_special_tokens=True))
+            if language is None:
+                # Output starts <|startoftranscript|><|lang|>...
+                language = self.processor.tokenizer.convert_ids_to_tokens(int(tokens[1])).strip("<|>")
+        return " ".join(text.strip() for text in texts), language
+
+# Loaded models shared across transcriptions. Up to four stay resident so
+# switching between model sizes only pays each load once.
+@functools.lru_cache(maxsize=4)
+def _load(backend, name, device, ct):
+    if backend == "faster":
+        return WhisperModel(name, device=device, compute_type=ct)
+    if backend == "trt":
+        return TensorRTWhisper(name, device)
+    model = whisper.load_model(name, device=device)
+    if device == "cuda":
+        if TORCH_COMPILE:
+            model = compile_model(model, device)
+    elif device == "cpu" and optimize_model is not None:
+        # INT8 weights on CPU, matmuls go through VNNI where available
+        model = optimize_model(model, low_bit="sym_int8")
+    return model
+
+# lru_cache does not stop two threads loading the same model at once. One
+# lock per key, so a cached tiny model never waits behind a large download.
+_LOAD_LOCKS = {}
+_LOAD_LOCKS_LOCK = threading.Lock()
+
+def get_model(name, device, backend=None):
+    backend = backend or default_backend()
+    ct = compute_type(device) if backend == "faster" else None
+    key = (backend, name, device, ct)
+    with _LOAD_LOCKS_LOCK:
+        lock = _LOAD_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        return _load(*key)
+
+def free_models():
+    _load.cache_clear()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+WHISPER_SAMPLE_RATE = 16000
+
+def to_whisper_input(audio_data, sample_rate):
+    # Every backend takes a mono float32 array at 16 kHz directly
+    audio = np.ascontiguousarray(audio_data.reshape(-1), dtype=np.float32)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        audio = resample_poly(audio, WHISPER_SAMPLE_RATE, sample_rate).astype(np.float32)
+    return audio
+
+# Page-locked staging buffer for host to GPU copies, grown by doubling
+_PINNED = None
+_PINNED_EVENT = None
+_PINNED_LOCK = threading.Lock()
+
+def to_cuda(audio):
+    global _PINNED, _PINNED_EVENT
+    n = audio.shape[0]
+    with _PINNED_LOCK:
+        if _PINNED_EVENT is not None:
+            # The previous async copy must be done reading the buffer
+            _PINNED_EVENT.synchronize()
+        if _PINNED is None or _PINNED.numel() < n:
+            size = max(n, 30 * WHISPER_SAMPLE_RATE, 2 * _PINNED.numel() if _PINNED is not None else 0)
+            _PINNED = torch.empty(size, dtype=torch.float32, pin_memory=True)
+        buf = _PINNED[:n]
+        buf.copy_(torch.from_numpy(audio))
+        audio_tensor = buf.to("cuda", non_blocking=True)
+        _PINNED_EVENT = torch.cuda.Event()
+        _PINNED_EVENT.record()
+        return audio_tensor
+
+# Cached models are shared between threads, but openai-whisper installs its
+# KV-cache hooks on the model for each call, so each model runs one
+# transcription at a time
+_INFERENCE_LOCKS = weakref.WeakKeyDictionary()
+_INFERENCE_LOCKS_LOCK = threading.Lock()
+
+def inference_lock(model):
+    with _INFERENCE_LOCKS_LOCK:
+        return _INFERENCE_LOCKS.setdefault(model, threading.Lock())
+
+def transcribe_audio(model, backend, audio, device, **options):
+    # Returns (text, language) regardless of backend
+    with inference_lock(model):
+        return _transcribe(model, backend, audio, device, **options)
+
+def _transcribe(model, backend, audio, device, **options):
+    if backend == "faster":
+        segments, info = model.transcribe(audio, beam_size=1, **options)
+        return "".join(segment.text for segment in segments), info.language
+    if backend == "trt":
+        # Prompting options are not supported by the exported generate()
+        return model.transcribe(audio)
+    if device == "cuda":
+        audio = to_cuda(audio)
+    result = model.transcribe(audio, fp16=use_fp16(device), **options)
+    return result["text"], result["language"]
+
+class StreamResampler:
+    # Polyphase FIR resampler that carries its input history across blocks, so
+    # audio can be converted block by block while recording
+    def __init__(self, in_rate, out_rate):
+        g = math.gcd(in_rate, out_rate)
+        self.up = out_rate // g
+        self.down = in_rate // g
+
+        # Same anti-aliasing filter resample_poly designs, split into one row
+        # of taps per output phase (newest input sample first)
+        half_len = 10 * max(self.up, self.down)
+        taps = firwin(2 * half_len + 1, 1.0 / max(self.up, self.down), window=("kaiser", 5.0)) * self.up
+        self._ntaps = -(-taps.size // self.up)
+        taps = np.concatenate([taps, np.zeros(self._ntaps * self.up - taps.size)])
+        self._phases = taps.reshape(self._ntaps, self.up).T.astype(np.float32)
+
+        # Work buffer: the last _ntaps - 1 input samples followed by the
+        # current block, reused between calls instead of concatenating
+        self._x = np.zeros(self._ntaps - 1 + 1024, dtype=np.float32)
+        self._start = 1 - self._ntaps  # input index of _x[0]
+        self._m = 0  # upsampled index of the next output sample
+
+        # Scratch arrays for the polyphase gather, grown to the largest
+        # output count seen so steady-state calls do not allocate
+        self._tap_offsets = np.arange(self._ntaps)
+        self._capacity = 0
+        self._reserve(1024)
+
+    def _reserve(self, count):
+        if count <= self._capacity:
+            return
+        self._capacity = count
+        self._steps = self.down * np.arange(count, dtype=np.int64)
+        self._pos = np.empty(count, dtype=np.int64)
+        self._phase = np.empty(count, dtype=np.int64)
+        self._newest = np.empty(count, dtype=np.int64)
+        self._index = np.empty((count, self._ntaps), dtype=np.int64)
+        self._window = np.empty((count, self._ntaps), dtype=np.float32)
+        self._coefs = np.empty((count, self._ntaps), dtype=np.float32)
+        self._out = np.empty(count, dtype=np.float32)
+
+    def process(self, block):
+        h = self._ntaps - 1
+        n = h + block.size
+        if n > self._x.size:
+            x = np.empty(n, dtype=np.float32)
+            x[:h] = self._x[:h]
+            self._x = x
+        x = self._x[:n]
+        np.copyto(x[h:], block)
+        total = self._start + n
+
+        # Emit every output whose newest input sample has arrived. The result
+        # is a view of a scratch array, valid until the next call.
+        count = max(0, (total * self.up - 1 - self._m) // self.down + 1)
+        self._reserve(count)
+        m = np.add(self._steps[:count], self._m, out=self._pos[:count])
+        phase = np.remainder(m, self.up, out=self._phase[:count])
+        newest = np.floor_divide(m, self.up, out=self._newest[:count])
+        newest -= self._start
+        index = np.subtract(newest[:, None], self._tap_offsets, out=self._index[:count])
+        window = np.take(x, index, out=self._window[:count], mode="clip")
+        coefs = np.take(self._phases, phase, axis=0, out=self._coefs[:count], mode="clip")
+        out = np.einsum("ij,ij->i", coefs, window, out=self._out[:count])
+
+        self._m += count * self.down
+        x[:h] = x[n - h:]
+        self._start = total - h
+        return out
 
 class AudioRecorder(QThread):
     finished = QtSignal(np.ndarray)
     error = QtSignal(str)
 
-    def __init__(self, device, samplerate=16000):
+    def __init__(self, device, samplerate=16000, max_seconds=600, chunk_queue=None, ring_seconds=4):
         super().__init__()
         self.device = device
         self.samplerate = samplerate
+        # Audio is stored at Whisper's rate, converted on the fly if needed
+        self.output_rate = WHISPER_SAMPLE_RATE
+        if samplerate != self.output_rate:
+            self._resampler = StreamResampler(samplerate, self.output_rate)
+        else:
+            self._resampler = None
+        # Optional consumer of live audio blocks (see StreamingTranscriber)
+        self.chunk_queue = chunk_queue
         self.recording = False
-        self.audio_data = []
+        self._stop_event = threading.Event()
+        # Single-producer/single-consumer ring of raw device-rate samples
+        # between the realtime callback and this thread. Each side only stores
+        # its own counter, and resampling happens on this side, so the
+        # callback never waits on a lock or allocates.
+        self._ring = np.empty(ring_seconds * samplerate, dtype=np.float32)
+        self._ring_w = RawValue('Q', 0)
+        self._ring_r = RawValue('Q', 0)
+        # One contiguous buffer holding the whole recording
+        self._buf = np.empty(max_seconds * self.output_rate, dtype=np.float32)
+        self._w = 0
 
     def run(self):
         try:
-            with sd.InputStream(device=self.device, channels=1, samplerate=self.samplerate, callback=self.audio_callback):
+            with sd.InputStream(device=self.device, channels=1, samplerate=self.samplerate, dtype='float32',
+                                blocksize=1024, latency='low', callback=self.audio_callback):
                 while self.recording:
-                    sd.sleep(100)
-            
-            if self.audio_data:
-                audio_array = np.concatenate(self.audio_data, axis=0)
-                self.finished.emit(audio_array)
+                    self._stop_event.wait(0.1)
+                    self._drain()
+            self._drain()
+
+            if self._w:
+                self.finished.emit(self._buf[:self._w])
             else:
                 self.error.emit("No audio data recorded")
         except sd.PortAudioError as e:
             self.error.emit(str(e))
+        finally:
+            if self.chunk_queue is not None:
+                self.chunk_queue.put(None)
 
     def audio_callback(self, indata, frames, time, status):
         if status:
             print(status)
-        self.audio_data.append(indata.copy())
+        samples = indata[:, 0]
+        n = samples.size
+        size = self._ring.size
+        w = self._ring_w.value
+        if w + n - self._ring_r.value > size:
+            print("Audio ring buffer overflow, dropping block")
+            return
+        i = w % size
+        first = min(n, size - i)
+        np.copyto(self._ring[i:i + first], samples[:first])
+        np.copyto(self._ring[:n - first], samples[first:])
+        # Publish only after the samples are in place
+        self._ring_w.value = w + n
+
+    def _drain(self):
+        # Move everything the callback has published into the recording buffer
+        w = self._ring_w.value
+        r = self._ring_r.value
+        n = w - r
+        if not n:
+            return
+        size = self._ring.size
+        i = r % size
+        first = min(n, size - i)
+        for piece in (self._ring[i:i + first], self._ring[:n - first]):
+            if piece.size:
+                if self._resampler is not None:
+                    piece = self._resampler.process(piece)
+                self._append(piece)
+        # Both pieces are copied out, the callback may reuse the space
+        self._ring_r.value = w
+
+    def _append(self, samples):
+        end = self._w + samples.size
+        if end > self._buf.size:
+            # Recording outgrew the buffer, double it (amortized O(N))
+            self._buf = np.resize(self._buf, max(end, 2 * self._buf.size))
+        np.copyto(self._buf[self._w:end], samples)
+        if self.chunk_queue is not None:
+            # The slice stays valid even if the buffer is later regrown
+            self.chunk_queue.put(self._buf[self._w:end])
+        self._w = end
 
     def stop(self):
         self.recording = False
+        self._stop_event.set()
 
 class WhisperTranscriber(QThread):
     finished = QtSignal(str)
     language_detected = QtSignal(str)
     error = QtSignal(str)
 
-    def __init__(self, audio_data, sample_rate, model_name):
+    def __init__(self, audio_data, sample_rate, model_name, device=None, backend=None):
         super().__init__()
         self.audio_data = audio_data
         self.sample_rate = sample_rate
         self.model_name = model_name
-        self.model = None
+        self.device = device
+        self.backend = backend or default_backend()
 
     def run(self):
         try:
-            # Load the selected model
-            self.model = whisper.load_model(self.model_name)
+            device = self.device or default_device()
+
+            # Load the selected model (cached after the first run). Kept local
+            # so "Free memory" can release it once this thread is done.
+            model = get_model(self.model_name, device, self.backend)
 
-            # Create a temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_wav:
-                sf.write(temp_wav.name, self.audio_data, self.sample_rate)
-                temp_wav_path = temp_wav.name
+            audio = to_whisper_input(self.audio_data, self.sample_rate)
 
-            # Transcribe the audio using the temporary file path
-            result = self.model.transcribe(temp_wav_path)
+            # Transcribe the in-memory audio, no temporary file or ffmpeg decode
+            text, language = transcribe_audio(model, self.backend, audio, device)
 
             # Emit the detected language
-            self.language_detected.emit(f"Detected language: {result['language']}")
+            self.language_detected.emit(f"Detected language: {language}")
 
             # Emit the transcribed text
-            self.finished.emit(result["text"])
+            self.finished.emit(text)
+        except Exception as e:
+            self.error.emit(str(e))
+
+class ModelWarmup(QThread):
+    ready = QtSignal()
+    error = QtSignal(str)
+
+    def __init__(self, model_name, device=None, backend=None):
+        super().__init__()
+        self.model_name = model_name
+        self.device = device
+        self.backend = backend or default_backend()
+
+    def run(self):
+        try:
+            device = self.device or default_device()
+            model = get_model(self.model_name, device, self.backend)
+
+            # One second of silence pays kernel selection and allocator warmup up front
+            transcribe_audio(model, self.backend, np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32), device)
+            self.ready.emit()
         except Exception as e:
             self.error.emit(str(e))
-            
+
+# Sample rates webrtcvad accepts, and its frame length in ms
+VAD_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+VAD_FRAME_MS = 30
+
+class StreamingTranscriber(QThread):
+    partial = QtSignal(str)
+    finished = QtSignal(str)
+    language_detected = QtSignal(str)
+    error = QtSignal(str)
+
+    def __init__(self, chunk_queue, sample_rate, model_name, device=None, backend=None,
+                 window_seconds=30, silence_seconds=0.5):
+        super().__init__()
+        self.chunk_queue = chunk_queue
+        self.sample_rate = sample_rate
+        self.model_name = model_name
+        self.device = device
+        self.backend = backend or default_backend()
+        self.model = None
+        self.text = ""
+
+        # Sliding window of audio not yet transcribed
+        self._window = np.empty(window_seconds * sample_rate, dtype=np.float32)
+        self._n = 0
+
+        # Without a usable VAD, chunks are only cut when the window fills
+        if webrtcvad is not None and sample_rate in VAD_SAMPLE_RATES:
+            self._vad = webrtcvad.Vad(2)
+        else:
+            self._vad = None
+        self._frame = sample_rate * VAD_FRAME_MS // 1000
+        self._silence_frames = int(silence_seconds * 1000) // VAD_FRAME_MS
+        self._reset_vad()
+
+    def run(self):
+        try:
+            self.device = self.device or default_device()
+            self.model = get_model(self.model_name, self.device, self.backend)
+
+            # The recorder puts None once the stream is closed
+            while True:
+                chunk = self.chunk_queue.get()
+                if chunk is None:
+                    break
+                self._append(chunk)
+
+            self._flush()
+            self.finished.emit(self.text)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            # Do not keep the model alive past this session, see free_models
+            self.model = None
+
+    def _append(self, chunk):
+        while chunk.size:
+            n = min(chunk.size, self._window.size - self._n)
+            self._window[self._n:self._n + n] = chunk[:n]
+            self._n += n
+            chunk = chunk[n:]
+            if self._pause_detected() or self._n == self._window.size:
+                self._flush()
+
+    def _pause_detected(self):
+        if self._vad is None:
+            return False
+        while self._vad_pos + self._frame <= self._n:
+            frame = self._window[self._vad_pos:self._vad_pos + self._frame]
+            pcm = (np.clip(frame, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+            if self._vad.is_speech(pcm, self.sample_rate):
+                self._speech = True
+                self._silent = 0
+            else:
+                self._silent += 1
+            self._vad_pos += self._frame
+        return self._speech and self._silent >= self._silence_frames
+
+    def _flush(self):
+        # Skip windows the VAD saw no speech in, Whisper hallucinates on silence
+        if self._n and (self._speech or self._vad is None):
+            audio = to_whisper_input(self._window[:self._n], self.sample_rate)
+            text, language = transcribe_audio(self.model, self.backend, audio, self.device,
+                                              condition_on_previous_text=True,
+                                              initial_prompt=self.text or None)
+            if not self.text:
+                self.language_detected.emit(f"Detected language: {language}")
+            self.text += text
+            self.partial.emit(text)
+        self._n = 0
+        self._reset_vad()
+
+    def _reset_vad(self):
+        self._vad_pos = 0
+        self._silent = 0
+        self._speech = False
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Audio Transcription App")
         self.layout = QVBoxLayout()
 
+        # Supported sample rates per device id, probing PortAudio is slow
+        self._rate_cache = {}
+
         self.device_combo = QComboBox()
         self.update_device_list()
         self.device_combo.currentIndexChanged.connect(self.update_samplerate_list)
         self.layout.addWidget(self.device_combo)
 
+        self.refresh_button = QPushButton("Refresh devices")
+        self.refresh_button.clicked.connect(self.refresh_devices)
+        self.layout.addWidget(self.refresh_button)
+
         self.samplerate_combo = QComboBox()
         self.update_samplerate_list()
         self.layout.addWidget(self.samplerate_combo)
@@ -96,6 +580,20 @@ class MainWindow(QWidget):
         self.update_model_list()
         self.layout.addWidget(self.model_combo)
 
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(available_backends())
+        self.layout.addWidget(self.backend_combo)
+
+        # Evict cached models, e.g. after trying large/medium
+        self.free_button = QPushButton("Free memory")
+        self.free_button.clicked.connect(self.free_memory)
+        self.layout.addWidget(self.free_button)
+
+        # Transcribe while recording instead of after Stop
+        self.streaming_checkbox = QCheckBox("Live transcription")
+        self.streaming_checkbox.setChecked(True)
+        self.layout.addWidget(self.streaming_checkbox)
+
         self.record_button = QPushButton("Record")
         self.record_button.clicked.connect(self.toggle_recording)
         self.layout.addWidget(self.record_button)
@@ -107,10 +605,35 @@ class MainWindow(QWidget):
         self.setLayout(self.layout)
 
         self.recorder = None
+        self.streamer = None
         self.is_recording = False
 
+        # Load and warm up the selected model before the first recording
+        self.record_button.setEnabled(False)
+        self.warmup = ModelWarmup(self.model_combo.currentText(), backend=self.backend_combo.currentText())
+        self.warmup.ready.connect(self.on_warmup_finished)
+        self.warmup.error.connect(self.on_warmup_error)
+        self.warmup.start()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _devices():
+        # Enumerating devices scans every PortAudio host API, do it once
+        return sd.query_devices()
+
+    def refresh_devices(self):
+        if self.recorder and self.recorder.isRunning():
+            QMessageBox.warning(self, "Error", "Stop recording before refreshing devices.")
+            return
+        # PortAudio only enumerates devices when it is initialized
+        sd._terminate()
+        sd._initialize()
+        MainWindow._devices.cache_clear()
+        self._rate_cache.clear()
+        self.update_device_list()
+
     def update_device_list(self):
-        devices = sd.query_devices()
+        devices = self._devices()
         self.device_combo.clear()
         for i, dev in enumerate(devices):
             if dev['max_input_channels'] > 0:
@@ -119,11 +642,18 @@ class MainWindow(QWidget):
     def update_samplerate_list(self):
         device_id = self.device_combo.currentData()
         if device_id is not None:
-            device_info = sd.query_devices(device_id, 'input')
-            supported_samplerates = self.get_supported_samplerates(device_info)
+            supported_samplerates = self._rate_cache.get(device_id)
+            if supported_samplerates is None:
+                device_info = self._devices()[device_id]
+                supported_samplerates = self.get_supported_samplerates(device_info)
+                self._rate_cache[device_id] = supported_samplerates
             self.samplerate_combo.clear()
             for rate in supported_samplerates:
                 self.samplerate_combo.addItem(f"{rate} Hz", rate)
+            # Recording at Whisper's rate avoids resampling altogether
+            index = self.samplerate_combo.findData(WHISPER_SAMPLE_RATE)
+            if index >= 0:
+                self.samplerate_combo.setCurrentIndex(index)
 
     def get_supported_samplerates(self, device_info):
         supported = []
@@ -147,7 +677,22 @@ class MainWindow(QWidget):
         if device is None or samplerate is None:
             QMessageBox.warning(self, "Error", "Please select a device and sample rate.")
             return
-        self.recorder = AudioRecorder(device, samplerate)
+        if self.streamer:
+            # Record is only re-enabled once the previous streamer emitted its
+            # final text, wait for the thread itself to exit before dropping it
+            self.streamer.wait()
+        chunk_queue = None
+        self.streamer = None
+        if self.streaming_checkbox.isChecked():
+            chunk_queue = queue.Queue()
+            self.streamer = StreamingTranscriber(chunk_queue, WHISPER_SAMPLE_RATE, self.model_combo.currentText(),
+                                                 backend=self.backend_combo.currentText())
+            self.streamer.partial.connect(self.on_partial_transcription)
+            self.streamer.finished.connect(self.on_streaming_finished)
+            self.streamer.error.connect(self.on_streaming_error)
+            self.transcription_text.clear()
+            self.streamer.start()
+        self.recorder = AudioRecorder(device, samplerate, chunk_queue=chunk_queue)
         self.recorder.finished.connect(self.on_recording_finished)
         self.recorder.error.connect(self.on_error)
         self.recorder.recording = True
@@ -160,13 +705,32 @@ class MainWindow(QWidget):
             self.recorder.stop()
             self.is_recording = False
             self.record_button.setText("Record")
+            if self.streamer and self.streamer.isRunning():
+                # Keep this session's text box until the last window is transcribed
+                self.record_button.setEnabled(False)
 
-    def on_recording_finished(self, audio_data):
-        sample_rate = self.samplerate_combo.currentData()
-        self.transcriber = WhisperTranscriber(audio_data, sample_rate)
-        self.transcriber.finished.connect(self.on_transcription_finished)
-        self.transcriber.error.connect(self.on_error)
-        self.transcriber.start()
+    def free_memory(self):
+        free_models()
+
+    def on_warmup_finished(self):
+        self.record_button.setEnabled(True)
+
+    def on_warmup_error(self, error_message):
+        # Recording still works, the model just loads on first use
+        self.record_button.setEnabled(True)
+        self.on_error(error_message)
+
+    def on_partial_transcription(self, text):
+        self.transcription_text.moveCursor(QTextCursor.End)
+        self.transcription_text.insertPlainText(text)
+
+    def on_streaming_finished(self, text):
+        self.record_button.setEnabled(True)
+        self.on_transcription_finished(text)
+
+    def on_streaming_error(self, error_message):
+        self.record_button.setEnabled(True)
+        self.on_error(error_message)
 
     def on_transcription_finished(self, text):
         self.transcription_text.setPlainText(text)
@@ -180,6 +744,9 @@ class MainWindow(QWidget):
         self.stop_recording()
         if self.recorder:
             self.recorder.wait()
+        if self.streamer:
+            self.streamer.wait()
+        self.warmup.wait()
         event.accept()
         
     def update_model_list(self):
@@ -188,9 +755,13 @@ class MainWindow(QWidget):
             self.model_combo.addItem(model)
 
     def on_recording_finished(self, audio_data):
-        sample_rate = self.samplerate_combo.currentData()
+        if self.streamer:
+            # Already transcribed live, the streamer emits the final text
+            return
+        sample_rate = self.recorder.output_rate
         model_name = self.model_combo.currentText()
-        self.transcriber = WhisperTranscriber(audio_data, sample_rate, model_name)
+        backend = self.backend_combo.currentText()
+        self.transcriber = WhisperTranscriber(audio_data, sample_rate, model_name, backend=backend)
         self.transcriber.finished.connect(self.on_transcription_finished)
         self.transcriber.error.connect(self.on_error)
         self.transcriber.start()
@@ -211,9 +782,13 @@ if __name__ == "__main__":
     # Handle SIGINT (Ctrl+C)
     signal.signal(signal.SIGINT, app.signal_handler)
     
-    # Use a timer to allow Python to process signals
-    timer = QTimer()
-    timer.start(500)
-    timer.timeout.connect(lambda: None)
+    # Wake the Qt event loop when a signal arrives so Python can run the
+    # handler, instead of polling with a timer
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Read)
+    notifier.activated.connect(lambda _: rsock.recv(1))
     
     sys.exit(app.exec_())